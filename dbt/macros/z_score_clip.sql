@@ -1,12 +1,19 @@
-{% macro z_score_clip(column_name, threshold=3.0) %}
+{% macro z_score_clip(column_name, mean_expr=none, stddev_expr=none, threshold=3.0) %}
+    {#- Clamp with LEAST/GREATEST (the SQL analog of Series.clip) instead of
+        re-deriving the z-score in separate CASE branches for each tail, which
+        evaluated the AVG/STDDEV window functions up to five times per column.
+        Callers can pass precomputed mean/stddev expressions (e.g. from a
+        single-scan stats CTE) to avoid the window functions entirely -#}
+    {%- set mean_expr = mean_expr if mean_expr is not none else 'AVG(' ~ column_name ~ ') OVER()' -%}
+    {%- set stddev_expr = stddev_expr if stddev_expr is not none else 'STDDEV(' ~ column_name ~ ') OVER()' -%}
     CASE
-        WHEN STDDEV({{ column_name }}) OVER() = 0 THEN {{ column_name }}
-        WHEN ({{ column_name }} - AVG({{ column_name }}) OVER()) 
-             / STDDEV({{ column_name }}) OVER() > {{ threshold }}
-        THEN AVG({{ column_name }}) OVER() + {{ threshold }} * STDDEV({{ column_name }}) OVER()
-        WHEN ({{ column_name }} - AVG({{ column_name }}) OVER()) 
-             / STDDEV({{ column_name }}) OVER() < -{{ threshold }}
-        THEN AVG({{ column_name }}) OVER() - {{ threshold }} * STDDEV({{ column_name }}) OVER()
-        ELSE {{ column_name }}
+        -- NULL must pass through explicitly: GREATEST/LEAST ignore NULL
+        -- arguments on Postgres and would clamp NULLs to the upper bound
+        WHEN {{ column_name }} IS NULL THEN NULL
+        WHEN {{ stddev_expr }} = 0 THEN {{ column_name }}
+        ELSE GREATEST(
+            LEAST({{ column_name }}, {{ mean_expr }} + {{ threshold }} * {{ stddev_expr }}),
+            {{ mean_expr }} - {{ threshold }} * {{ stddev_expr }}
+        )
     END
 {% endmacro %}
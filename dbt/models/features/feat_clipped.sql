@@ -1,5 +1,32 @@
 -- Z-score clip outliers at 3 standard deviations
 -- Replaces ZScoreClipper (step 9)
+--
+-- The clip statistics for every column are computed in one aggregate scan
+-- (clip_stats) and cross-joined back in, instead of per-column AVG/STDDEV
+-- window functions that each re-scan the input
+
+WITH source AS (
+    SELECT * FROM {{ ref('feat_season_progress') }}
+),
+
+clip_stats AS (
+    SELECT
+        AVG(qualifying_position) AS qualifying_position_mean,
+        STDDEV(qualifying_position) AS qualifying_position_stddev,
+        AVG(grid) AS grid_mean,
+        STDDEV(grid) AS grid_stddev,
+        AVG(finish_position_filled) AS finish_position_filled_mean,
+        STDDEV(finish_position_filled) AS finish_position_filled_stddev,
+        AVG(race_time_ms) AS race_time_ms_mean,
+        STDDEV(race_time_ms) AS race_time_ms_stddev,
+        AVG(points) AS points_mean,
+        STDDEV(points) AS points_stddev,
+        AVG(driver_championship_points) AS driver_championship_points_mean,
+        STDDEV(driver_championship_points) AS driver_championship_points_stddev,
+        AVG(team_championship_points) AS team_championship_points_mean,
+        STDDEV(team_championship_points) AS team_championship_points_stddev
+    FROM source
+)
 
 SELECT
     -- Pass through non-clipped columns
@@ -18,13 +45,14 @@ SELECT
     driver_wins, team_wins,
     driver_championship_position,
     team_championship_position,
-    
+
     -- Clipped columns (matching the current pipeline config)
-    {{ z_score_clip('qualifying_position') }} AS qualifying_position,
-    {{ z_score_clip('grid') }} AS grid,
-    {{ z_score_clip('finish_position_filled') }} AS finish_position,
-    {{ z_score_clip('race_time_ms') }} AS race_time_ms_clipped,
-    {{ z_score_clip('points') }} AS points,
-    {{ z_score_clip('driver_championship_points') }} AS driver_championship_points,
-    {{ z_score_clip('team_championship_points') }} AS team_championship_points
-FROM {{ ref('feat_season_progress') }}
+    {{ z_score_clip('qualifying_position', 'qualifying_position_mean', 'qualifying_position_stddev') }} AS qualifying_position,
+    {{ z_score_clip('grid', 'grid_mean', 'grid_stddev') }} AS grid,
+    {{ z_score_clip('finish_position_filled', 'finish_position_filled_mean', 'finish_position_filled_stddev') }} AS finish_position,
+    {{ z_score_clip('race_time_ms', 'race_time_ms_mean', 'race_time_ms_stddev') }} AS race_time_ms_clipped,
+    {{ z_score_clip('points', 'points_mean', 'points_stddev') }} AS points,
+    {{ z_score_clip('driver_championship_points', 'driver_championship_points_mean', 'driver_championship_points_stddev') }} AS driver_championship_points,
+    {{ z_score_clip('team_championship_points', 'team_championship_points_mean', 'team_championship_points_stddev') }} AS team_championship_points
+FROM source
+CROSS JOIN clip_stats
@@ -2,6 +2,11 @@
 -- Custom implementation to handle special characters in names
 -- Replaces CategoricalEncoder (step 5) for driver_abbreviation
 
+-- Materialized as a view: only the final training dataset is written to
+-- disk, so the OHE chain no longer copies the full table once per
+-- categorical column
+{{ config(materialized='view') }}
+
 {% set drivers_query %}
     SELECT DISTINCT driver_abbreviation 
     FROM {{ ref('prep_ohe_team') }}
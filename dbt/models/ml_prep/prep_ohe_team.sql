@@ -2,6 +2,11 @@
 -- Custom implementation to handle special characters in names
 -- Replaces CategoricalEncoder (step 5) for team_name
 
+-- Materialized as a view: only the final training dataset is written to
+-- disk, so the OHE chain no longer copies the full table once per
+-- categorical column
+{{ config(materialized='view') }}
+
 {% set teams_query %}
     SELECT DISTINCT team_name 
     FROM {{ ref('prep_ohe_circuit') }}
@@ -1,6 +1,61 @@
 -- Apply StandardScaler to numeric columns
 -- Replaces NumericalScaler (step 6)
 -- Using inline SQL with NULLIF to handle zero stddev
+--
+-- All scaling statistics come from one aggregate scan (scaling_stats) and
+-- are cross-joined back in, mirroring a single multivariate scaler fit
+-- instead of per-column AVG/STDDEV window functions that re-scan the input
+
+WITH source AS (
+    SELECT * FROM {{ ref('prep_feature_set') }}
+),
+
+scaling_stats AS (
+    SELECT
+        AVG(qualifying_position) AS qualifying_position_mean,
+        STDDEV_POP(qualifying_position) AS qualifying_position_stddev,
+        AVG(grid) AS grid_mean,
+        STDDEV_POP(grid) AS grid_stddev,
+        AVG(points) AS points_mean,
+        STDDEV_POP(points) AS points_stddev,
+        AVG(driver_championship_points) AS driver_championship_points_mean,
+        STDDEV_POP(driver_championship_points) AS driver_championship_points_stddev,
+        AVG(team_championship_points) AS team_championship_points_mean,
+        STDDEV_POP(team_championship_points) AS team_championship_points_stddev,
+        AVG(driver_championship_position) AS driver_championship_position_mean,
+        STDDEV_POP(driver_championship_position) AS driver_championship_position_stddev,
+        AVG(driver_wins) AS driver_wins_mean,
+        STDDEV_POP(driver_wins) AS driver_wins_stddev,
+        AVG(team_championship_position) AS team_championship_position_mean,
+        STDDEV_POP(team_championship_position) AS team_championship_position_stddev,
+        AVG(team_wins) AS team_wins_mean,
+        STDDEV_POP(team_wins) AS team_wins_stddev,
+        AVG(q1_seconds) AS q1_seconds_mean,
+        STDDEV_POP(q1_seconds) AS q1_seconds_stddev,
+        AVG(q2_seconds) AS q2_seconds_mean,
+        STDDEV_POP(q2_seconds) AS q2_seconds_stddev,
+        AVG(q3_seconds) AS q3_seconds_mean,
+        STDDEV_POP(q3_seconds) AS q3_seconds_stddev,
+        AVG(race_time_ms) AS race_time_ms_mean,
+        STDDEV_POP(race_time_ms) AS race_time_ms_stddev,
+        AVG(prev_race_points) AS prev_race_points_mean,
+        STDDEV_POP(prev_race_points) AS prev_race_points_stddev,
+        AVG(prev_race_driver_championship_points) AS prev_race_driver_championship_points_mean,
+        STDDEV_POP(prev_race_driver_championship_points) AS prev_race_driver_championship_points_stddev,
+        AVG(prev_race_driver_championship_position) AS prev_race_driver_championship_position_mean,
+        STDDEV_POP(prev_race_driver_championship_position) AS prev_race_driver_championship_position_stddev,
+        AVG(prev_race_driver_wins) AS prev_race_driver_wins_mean,
+        STDDEV_POP(prev_race_driver_wins) AS prev_race_driver_wins_stddev,
+        AVG(prev_race_team_championship_points) AS prev_race_team_championship_points_mean,
+        STDDEV_POP(prev_race_team_championship_points) AS prev_race_team_championship_points_stddev,
+        AVG(prev_race_team_championship_position) AS prev_race_team_championship_position_mean,
+        STDDEV_POP(prev_race_team_championship_position) AS prev_race_team_championship_position_stddev,
+        AVG(prev_race_team_wins) AS prev_race_team_wins_mean,
+        STDDEV_POP(prev_race_team_wins) AS prev_race_team_wins_stddev,
+        AVG(prev_race_race_time_ms) AS prev_race_race_time_ms_mean,
+        STDDEV_POP(prev_race_race_time_ms) AS prev_race_race_time_ms_stddev
+    FROM source
+)
 
 SELECT
     -- Pass through columns
@@ -13,27 +68,28 @@ SELECT
     is_dnf,
     season_progress_percent,
     finish_position,
-    
+
     -- Scaled columns with NULLIF protection
-    (qualifying_position - AVG(qualifying_position) OVER()) / NULLIF(STDDEV_POP(qualifying_position) OVER(), 0) AS qualifying_position_scaled,
-    (grid - AVG(grid) OVER()) / NULLIF(STDDEV_POP(grid) OVER(), 0) AS grid_scaled,
-    (points - AVG(points) OVER()) / NULLIF(STDDEV_POP(points) OVER(), 0) AS points_scaled,
-    (driver_championship_points - AVG(driver_championship_points) OVER()) / NULLIF(STDDEV_POP(driver_championship_points) OVER(), 0) AS driver_championship_points_scaled,
-    (team_championship_points - AVG(team_championship_points) OVER()) / NULLIF(STDDEV_POP(team_championship_points) OVER(), 0) AS team_championship_points_scaled,
-    (driver_championship_position - AVG(driver_championship_position) OVER()) / NULLIF(STDDEV_POP(driver_championship_position) OVER(), 0) AS driver_championship_position_scaled,
-    (driver_wins - AVG(driver_wins) OVER()) / NULLIF(STDDEV_POP(driver_wins) OVER(), 0) AS driver_wins_scaled,
-    (team_championship_position - AVG(team_championship_position) OVER()) / NULLIF(STDDEV_POP(team_championship_position) OVER(), 0) AS team_championship_position_scaled,
-    (team_wins - AVG(team_wins) OVER()) / NULLIF(STDDEV_POP(team_wins) OVER(), 0) AS team_wins_scaled,
-    (q1_seconds - AVG(q1_seconds) OVER()) / NULLIF(STDDEV_POP(q1_seconds) OVER(), 0) AS q1_seconds_scaled,
-    (q2_seconds - AVG(q2_seconds) OVER()) / NULLIF(STDDEV_POP(q2_seconds) OVER(), 0) AS q2_seconds_scaled,
-    (q3_seconds - AVG(q3_seconds) OVER()) / NULLIF(STDDEV_POP(q3_seconds) OVER(), 0) AS q3_seconds_scaled,
-    (race_time_ms - AVG(race_time_ms) OVER()) / NULLIF(STDDEV_POP(race_time_ms) OVER(), 0) AS race_time_ms_scaled,
-    (prev_race_points - AVG(prev_race_points) OVER()) / NULLIF(STDDEV_POP(prev_race_points) OVER(), 0) AS prev_race_points_scaled,
-    (prev_race_driver_championship_points - AVG(prev_race_driver_championship_points) OVER()) / NULLIF(STDDEV_POP(prev_race_driver_championship_points) OVER(), 0) AS prev_race_driver_championship_points_scaled,
-    (prev_race_driver_championship_position - AVG(prev_race_driver_championship_position) OVER()) / NULLIF(STDDEV_POP(prev_race_driver_championship_position) OVER(), 0) AS prev_race_driver_championship_position_scaled,
-    (prev_race_driver_wins - AVG(prev_race_driver_wins) OVER()) / NULLIF(STDDEV_POP(prev_race_driver_wins) OVER(), 0) AS prev_race_driver_wins_scaled,
-    (prev_race_team_championship_points - AVG(prev_race_team_championship_points) OVER()) / NULLIF(STDDEV_POP(prev_race_team_championship_points) OVER(), 0) AS prev_race_team_championship_points_scaled,
-    (prev_race_team_championship_position - AVG(prev_race_team_championship_position) OVER()) / NULLIF(STDDEV_POP(prev_race_team_championship_position) OVER(), 0) AS prev_race_team_championship_position_scaled,
-    (prev_race_team_wins - AVG(prev_race_team_wins) OVER()) / NULLIF(STDDEV_POP(prev_race_team_wins) OVER(), 0) AS prev_race_team_wins_scaled,
-    (prev_race_race_time_ms - AVG(prev_race_race_time_ms) OVER()) / NULLIF(STDDEV_POP(prev_race_race_time_ms) OVER(), 0) AS prev_race_race_time_ms_scaled
-FROM {{ ref('prep_feature_set') }}
+    (qualifying_position - qualifying_position_mean) / NULLIF(qualifying_position_stddev, 0) AS qualifying_position_scaled,
+    (grid - grid_mean) / NULLIF(grid_stddev, 0) AS grid_scaled,
+    (points - points_mean) / NULLIF(points_stddev, 0) AS points_scaled,
+    (driver_championship_points - driver_championship_points_mean) / NULLIF(driver_championship_points_stddev, 0) AS driver_championship_points_scaled,
+    (team_championship_points - team_championship_points_mean) / NULLIF(team_championship_points_stddev, 0) AS team_championship_points_scaled,
+    (driver_championship_position - driver_championship_position_mean) / NULLIF(driver_championship_position_stddev, 0) AS driver_championship_position_scaled,
+    (driver_wins - driver_wins_mean) / NULLIF(driver_wins_stddev, 0) AS driver_wins_scaled,
+    (team_championship_position - team_championship_position_mean) / NULLIF(team_championship_position_stddev, 0) AS team_championship_position_scaled,
+    (team_wins - team_wins_mean) / NULLIF(team_wins_stddev, 0) AS team_wins_scaled,
+    (q1_seconds - q1_seconds_mean) / NULLIF(q1_seconds_stddev, 0) AS q1_seconds_scaled,
+    (q2_seconds - q2_seconds_mean) / NULLIF(q2_seconds_stddev, 0) AS q2_seconds_scaled,
+    (q3_seconds - q3_seconds_mean) / NULLIF(q3_seconds_stddev, 0) AS q3_seconds_scaled,
+    (race_time_ms - race_time_ms_mean) / NULLIF(race_time_ms_stddev, 0) AS race_time_ms_scaled,
+    (prev_race_points - prev_race_points_mean) / NULLIF(prev_race_points_stddev, 0) AS prev_race_points_scaled,
+    (prev_race_driver_championship_points - prev_race_driver_championship_points_mean) / NULLIF(prev_race_driver_championship_points_stddev, 0) AS prev_race_driver_championship_points_scaled,
+    (prev_race_driver_championship_position - prev_race_driver_championship_position_mean) / NULLIF(prev_race_driver_championship_position_stddev, 0) AS prev_race_driver_championship_position_scaled,
+    (prev_race_driver_wins - prev_race_driver_wins_mean) / NULLIF(prev_race_driver_wins_stddev, 0) AS prev_race_driver_wins_scaled,
+    (prev_race_team_championship_points - prev_race_team_championship_points_mean) / NULLIF(prev_race_team_championship_points_stddev, 0) AS prev_race_team_championship_points_scaled,
+    (prev_race_team_championship_position - prev_race_team_championship_position_mean) / NULLIF(prev_race_team_championship_position_stddev, 0) AS prev_race_team_championship_position_scaled,
+    (prev_race_team_wins - prev_race_team_wins_mean) / NULLIF(prev_race_team_wins_stddev, 0) AS prev_race_team_wins_scaled,
+    (prev_race_race_time_ms - prev_race_race_time_ms_mean) / NULLIF(prev_race_race_time_ms_stddev, 0) AS prev_race_race_time_ms_scaled
+FROM source
+CROSS JOIN scaling_stats
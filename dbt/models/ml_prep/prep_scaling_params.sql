@@ -1,5 +1,9 @@
 -- Stores mean/stddev for each scaled column (for inference reuse)
 -- This is the "fitted" scaler parameters
+--
+-- All statistics come from one aggregate scan over the feature set; the
+-- UNION ALL below only unpivots the single stats row, instead of the old
+-- one-full-table-scan-per-column layout
 
 {{ config(materialized='table') }}
 
@@ -15,11 +19,20 @@
     'prev_race_team_wins', 'prev_race_race_time_ms'
 ] %}
 
+WITH stats AS (
+    SELECT
+        {% for col in numeric_cols %}
+        AVG({{ col }})::float AS {{ col }}_mean,
+        STDDEV_POP({{ col }})::float AS {{ col }}_stddev{{ "," if not loop.last }}
+        {% endfor %}
+    FROM {{ ref('prep_feature_set') }}
+)
+
 {% for col in numeric_cols %}
 SELECT
     '{{ col }}' AS column_name,
-    AVG({{ col }})::float AS mean_val,
-    STDDEV_POP({{ col }})::float AS stddev_val
-FROM {{ ref('prep_feature_set') }}
+    {{ col }}_mean AS mean_val,
+    {{ col }}_stddev AS stddev_val
+FROM stats
 {% if not loop.last %}UNION ALL{% endif %}
 {% endfor %}
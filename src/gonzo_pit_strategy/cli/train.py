@@ -4,6 +4,7 @@ Command-line interface for training models using the new configuration-driven ar
 
 import argparse
 import json
+import logging
 import os
 import sys
 import itertools
@@ -203,8 +204,10 @@ def main():
         training_config = TrainingConfig(**config_dict)
     except Exception as e:
         logger.error(f"Invalid configuration: {e}")
-        # Print validation errors details if possible
-        logger.debug(f"Config dictionary: {json.dumps(config_dict, indent=2)}")
+        # Print validation errors details if possible; only serialize the
+        # config when DEBUG output is actually enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Config dictionary: {json.dumps(config_dict, indent=2)}")
         sys.exit(1)
 
     logger.info(f"Starting experiment with model type: {training_config.model.type}")
@@ -7,6 +7,13 @@ import json
 from pathlib import Path
 from typing import Dict, Any
 
+try:
+    # Optional fast path: orjson parses config files 2-3x faster and works
+    # directly on bytes, skipping the text-decode step
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 # Environment variables
 ENV_VAR_APP_ENV = "APP_ENV"
 DEFAULT_ENV = "development"
@@ -102,12 +109,17 @@ class Config:
         config_path = self.get_config_path(config_name)
 
         try:
-            with open(config_path, "r") as f:
-                parsed_config = json.load(f)
+            with open(config_path, "rb") as f:
+                raw = f.read()
+            if _orjson is not None:
+                parsed_config = _orjson.loads(raw)
+            else:
+                parsed_config = json.loads(raw)
             return parsed_config
         except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
-        except json.JSONDecodeError:
+        except ValueError:
+            # Covers both json.JSONDecodeError and orjson.JSONDecodeError
             raise ValueError(f"Invalid JSON in configuration file: {config_path}")
 
     @property
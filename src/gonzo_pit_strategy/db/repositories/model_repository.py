@@ -11,6 +11,12 @@ import json
 from datetime import datetime
 import tensorflow as tf
 
+try:
+    # Optional fast path: orjson serializes the metadata payload in C
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 from gonzo_pit_strategy.db.base import db_session
 from gonzo_pit_strategy.db.models.model_metadata import ModelMetadata
 from gonzo_pit_strategy.log.logger import get_logger
@@ -28,6 +34,55 @@ class ModelRepository:
             model_path: Base path for storing model artifacts
         """
         self.model_path = model_path
+        self._created_dirs = set()
+
+    def _version_dir(self, version: str, create: bool = True) -> str:
+        """Resolve the artifact directory for a model version.
+
+        Args:
+            version: Version string for the model
+            create: Whether to create the directory if it does not exist
+
+        Returns:
+            Path to the version's artifact directory
+        """
+        save_path = os.path.join(self.model_path, version)
+        # Memoize created directories so repeated saves of the same version
+        # (placeholder + final update) only pay the mkdir syscall once
+        if create and save_path not in self._created_dirs:
+            os.makedirs(save_path, exist_ok=True)
+            self._created_dirs.add(save_path)
+        return save_path
+
+    def _write_metadata_json(self, save_path: str, payload: Dict[str, Any]) -> None:
+        """Write model_metadata.json, skipping the write when nothing changed.
+
+        The saved_at stamp is excluded from the comparison so an otherwise
+        identical payload does not force a rewrite (and fsync) on every save.
+
+        Args:
+            save_path: The version's artifact directory
+            payload: Metadata payload, without the saved_at stamp
+        """
+        target = os.path.join(save_path, "model_metadata.json")
+        if os.path.exists(target):
+            try:
+                with open(target, "rb") as f:
+                    existing = json.loads(f.read())
+                existing.pop("saved_at", None)
+                if existing == payload:
+                    return
+            except ValueError:
+                # Unparseable file: fall through and rewrite it
+                pass
+
+        record = {**payload, "saved_at": datetime.now().isoformat()}
+        if _orjson is not None:
+            data = _orjson.dumps(record, option=_orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(record, indent=2).encode()
+        with open(target, "wb") as f:
+            f.write(data)
 
     def save_model(
         self, model: tf.keras.Model, version: str, metadata: Dict[str, Any]
@@ -43,8 +98,7 @@ class ModelRepository:
             model_id: The ID of the saved model metadata
         """
         # Save model to disk
-        save_path = os.path.join(self.model_path, version)
-        os.makedirs(save_path, exist_ok=True)
+        save_path = self._version_dir(version)
         model_file_path = os.path.join(
             save_path, metadata.get("model_name", "model.keras")
         )
@@ -69,16 +123,9 @@ class ModelRepository:
             session.refresh(model_metadata)
 
             # Save metadata to JSON file
-            with open(os.path.join(save_path, "model_metadata.json"), "w") as f:
-                json.dump(
-                    {
-                        **metadata,
-                        "model_id": model_metadata.model_id,
-                        "saved_at": datetime.now().isoformat(),
-                    },
-                    f,
-                    indent=2,
-                )
+            self._write_metadata_json(
+                save_path, {**metadata, "model_id": model_metadata.model_id}
+            )
 
             return model_metadata.model_id
 
@@ -126,8 +173,7 @@ class ModelRepository:
             metadata: Dictionary of updated model metadata
         """
         # Save model to disk
-        save_path = os.path.join(self.model_path, version)
-        os.makedirs(save_path, exist_ok=True)
+        save_path = self._version_dir(version)
         model_file_path = os.path.join(
             save_path, metadata.get("model_name", "model.keras")
         )
@@ -151,16 +197,7 @@ class ModelRepository:
                 session.commit()
 
         # Save metadata to JSON file
-        with open(os.path.join(save_path, "model_metadata.json"), "w") as f:
-            json.dump(
-                {
-                    **metadata,
-                    "model_id": model_id,
-                    "saved_at": datetime.now().isoformat(),
-                },
-                f,
-                indent=2,
-            )
+        self._write_metadata_json(save_path, {**metadata, "model_id": model_id})
 
     def load_model(
         self, version: str, model_name: Optional[str] = None
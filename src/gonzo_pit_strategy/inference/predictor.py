@@ -89,6 +89,35 @@ class ModelPredictor:
         #         )
         #         self.data_pipeline.load_artifacts(self.data_version)
 
+    def _extract_features(self, data: pd.DataFrame) -> np.ndarray:
+        """Extract the model's feature matrix from a DataFrame.
+
+        Args:
+            data: Input DataFrame
+
+        Returns:
+            Feature matrix as numpy array
+
+        Raises:
+            ValueError: If any expected feature column is missing from the data
+        """
+        if not self.feature_columns:
+            # If no feature columns specified, use all columns. to_numpy with
+            # copy=False hands back the existing buffer when the frame is
+            # already a single homogeneous block
+            return data.to_numpy(copy=False)
+
+        # Check if all feature columns are in the data; set membership makes
+        # each lookup O(1) instead of a scan over the column index
+        available = set(data.columns)
+        missing_columns = [
+            col for col in self.feature_columns if col not in available
+        ]
+        if missing_columns:
+            raise ValueError(f"Feature columns not found in data: {missing_columns}")
+
+        return data[self.feature_columns].to_numpy(copy=False)
+
     def predict(
         self, data: Union[pd.DataFrame, np.ndarray], apply_pipeline: bool = False
     ) -> np.ndarray:
@@ -101,50 +130,17 @@ class ModelPredictor:
         Returns:
             Predictions as numpy array
         """
-        # If data is a DataFrame and we need to apply pipeline transformations
-        if isinstance(data, pd.DataFrame) and apply_pipeline:
-            logger.warning("Pipeline application requested but pipeline is disabled.")
-            # self._initialize_pipeline()
-            #
-            # # Apply transformations
-            # for step in self.data_pipeline.steps:
-            #     # Only apply certain steps that are needed for inference
-            #     if step.name in ["CategoricalEncoder", "NumericalScaler"]:
-            #         data = step.process(data)
-
-            # Extract features
-            if self.feature_columns:
-                # Check if all feature columns are in the data
-                missing_columns = [
-                    col for col in self.feature_columns if col not in data.columns
-                ]
-                if missing_columns:
-                    raise ValueError(
-                        f"Feature columns not found in data: {missing_columns}"
-                    )
-
-                features = data[self.feature_columns].values
-            else:
-                # If no feature columns specified, use all columns
-                features = data.values
-
-        # If data is already a numpy array or we don't need to apply pipeline transformations
-        elif isinstance(data, pd.DataFrame):
-            # Extract features if feature columns are specified
-            if self.feature_columns:
-                # Check if all feature columns are in the data
-                missing_columns = [
-                    col for col in self.feature_columns if col not in data.columns
-                ]
-                if missing_columns:
-                    raise ValueError(
-                        f"Feature columns not found in data: {missing_columns}"
-                    )
-
-                features = data[self.feature_columns].values
-            else:
-                # If no feature columns specified, use all columns
-                features = data.values
+        if isinstance(data, pd.DataFrame):
+            if apply_pipeline:
+                logger.warning("Pipeline application requested but pipeline is disabled.")
+                # self._initialize_pipeline()
+                #
+                # # Apply transformations
+                # for step in self.data_pipeline.steps:
+                #     # Only apply certain steps that are needed for inference
+                #     if step.name in ["CategoricalEncoder", "NumericalScaler"]:
+                #         data = step.process(data)
+            features = self._extract_features(data)
         else:
             # Data is already a numpy array
             features = data
@@ -126,41 +126,55 @@ class Logger:
         handler.setFormatter(formatter)
         self._logger.addHandler(handler)
 
-    def debug(self, message: str, component: Optional[str] = None,
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether the underlying logger is enabled for the given level.
+
+        Args:
+            level: Logging level (e.g. logging.DEBUG)
+
+        Returns:
+            True if a message at this level would be emitted
+        """
+        return self._logger.isEnabledFor(level)
+
+    def debug(self, message: str, *args, component: Optional[str] = None,
              user_id: Optional[int] = None, correlation_id: Optional[str] = None) -> None:
         """Log a debug message.
 
         Args:
-            message: Log message
+            message: Log message (optionally a %-style format string)
+            *args: Arguments for lazy %-formatting of the message
             component: Optional component name (ignored)
             user_id: Optional user ID (ignored)
             correlation_id: Optional correlation ID (ignored)
         """
-        self._logger.debug(message)
+        self._logger.debug(message, *args)
 
-    def info(self, message: str, component: Optional[str] = None,
+    def info(self, message: str, *args, component: Optional[str] = None,
             user_id: Optional[int] = None, correlation_id: Optional[str] = None) -> None:
         """Log an info message.
 
         Args:
-            message: Log message
+            message: Log message (optionally a %-style format string)
+            *args: Arguments for lazy %-formatting of the message
             component: Optional component name (ignored)
             user_id: Optional user ID (ignored)
             correlation_id: Optional correlation ID (ignored)
         """
-        self._logger.info(message)
+        self._logger.info(message, *args)
 
-    def warning(self, message: str, component: Optional[str] = None,
+    def warning(self, message: str, *args, component: Optional[str] = None,
                user_id: Optional[int] = None, correlation_id: Optional[str] = None) -> None:
         """Log a warning message.
 
         Args:
-            message: Log message
+            message: Log message (optionally a %-style format string)
+            *args: Arguments for lazy %-formatting of the message
             component: Optional component name (ignored)
             user_id: Optional user ID (ignored)
             correlation_id: Optional correlation ID (ignored)
         """
-        self._logger.warning(message)
+        self._logger.warning(message, *args)
 
     def error(self, message: str, exc_info: bool = False, component: Optional[str] = None,
              user_id: Optional[int] = None, correlation_id: Optional[str] = None) -> None:
@@ -7,6 +7,8 @@ import keras
 from datetime import datetime
 import json
 
+from sqlalchemy import insert
+
 from gonzo_pit_strategy.db.models.training_metrics import TrainingMetric
 from gonzo_pit_strategy.db.models.training_runs import TrainingRun
 from gonzo_pit_strategy.db.models.dataset_versions import (
@@ -40,6 +42,15 @@ class MetricsLoggingCallback(keras.callbacks.Callback):
         super().__init__()
         self.run_id = run_id
         self.split_types = split_types or {"val_": "VALIDATION", "": "TRAIN"}
+        # Longest-prefix-first lookup table, precomputed once so the per-epoch
+        # loop neither iterates the dict nor relies on its insertion order
+        # (the empty-string prefix must always match last)
+        self._prefix_table = tuple(
+            sorted(
+                ((prefix, split, len(prefix)) for prefix, split in self.split_types.items()),
+                key=lambda entry: -entry[2],
+            )
+        )
 
     def on_epoch_end(self, epoch: int, logs: Dict[str, Any] = None) -> None:
         """
@@ -53,33 +64,38 @@ class MetricsLoggingCallback(keras.callbacks.Callback):
             return
 
         metrics = []
+        # Hoist the shared values out of the loop: one timestamp per epoch
+        # and no repeated attribute loads per metric
         timestamp = datetime.now()
+        run_id = self.run_id
+        prefix_table = self._prefix_table
 
         for metric_name, metric_value in logs.items():
             # Determine split type
             split_type = "TRAIN"  # Default
-            for prefix, split in self.split_types.items():
+            for prefix, split, prefix_len in prefix_table:
                 if metric_name.startswith(prefix):
                     split_type = split
                     # Remove prefix from metric name if it's a validation metric
-                    if prefix and prefix != "":
-                        metric_name = metric_name[len(prefix) :]
+                    if prefix_len:
+                        metric_name = metric_name[prefix_len:]
                     break
 
             metrics.append(
-                TrainingMetric(
-                    run_id=self.run_id,
-                    epoch=epoch,
-                    timestamp=timestamp,
-                    metric_name=metric_name,
-                    metric_value=float(metric_value),
-                    split_type=split_type,
-                )
+                {
+                    "run_id": run_id,
+                    "epoch": epoch,
+                    "timestamp": timestamp,
+                    "metric_name": metric_name,
+                    "metric_value": float(metric_value),
+                    "split_type": split_type,
+                }
             )
 
-        # Store all metrics for this epoch in a single transaction
+        # Store all metrics for this epoch in a single Core executemany
+        # INSERT, skipping the ORM unit-of-work for these append-only rows
         with db_session() as session:
-            session.add_all(metrics)
+            session.execute(insert(TrainingMetric), metrics)
             session.commit()
 
 
@@ -104,11 +120,14 @@ class ConsoleMetricsCallback(keras.callbacks.Callback):
         print(f"\n{epoch_str}")
         print("-" * len(epoch_str))
 
-        # Group metrics by split type
-        train_metrics = {k: v for k, v in logs.items() if not k.startswith("val_")}
-        val_metrics = {
-            k.replace("val_", ""): v for k, v in logs.items() if k.startswith("val_")
-        }
+        # Group metrics by split type in a single pass over logs
+        train_metrics = {}
+        val_metrics = {}
+        for name, value in logs.items():
+            if name.startswith("val_"):
+                val_metrics[name[4:]] = value
+            else:
+                train_metrics[name] = value
 
         # Print training metrics
         if train_metrics:
@@ -146,6 +165,22 @@ class GonzoExperimentCallback(keras.callbacks.Callback):
         self.repo = model_repo
         self.model_version = model_version
         self.config_path = config_path
+        # The config never mutates during a run, so serialize it once instead
+        # of re-dumping the whole Pydantic tree on every metadata build
+        self._config_dump = config.model_dump()
+        # Same goes for the repository metadata: the description and friends
+        # are fixed at construction, so build the dict once and reuse it for
+        # both the placeholder record and the final artifact save
+        self._metadata = {
+            "model_name": "f1_pit_strategy_model.keras",  # Could be config param
+            "model_version": model_version,
+            "description": config.description or f"{config.model.type} model",
+            "created_by": "GonzoExperimentCallback",
+            "architecture": config.model.type,
+            "tags": config.tags,
+            "config": self._config_dump,
+            "config_path": config_path,
+        }
         self.run_id = None
         self.model_id = None
         self.start_time = None
@@ -156,20 +191,10 @@ class GonzoExperimentCallback(keras.callbacks.Callback):
     def on_train_begin(self, logs=None):
         self.start_time = datetime.now()
 
-        # Prepare metadata
-        metadata = {
-            "model_name": "f1_pit_strategy_model.keras",  # Could be config param
-            "model_version": self.model_version,
-            "description": self.config.description or f"{self.config.model.type} model",
-            "created_by": "GonzoExperimentCallback",
-            "architecture": self.config.model.type,
-            "tags": self.config.tags,
-            "config": self.config.model_dump(),
-            "config_path": self.config_path,
-        }
-
         # Create placeholder model
-        self.model_id = self.repo.create_placeholder_model(self.model_version, metadata)
+        self.model_id = self.repo.create_placeholder_model(
+            self.model_version, self._metadata
+        )
 
         # Create TrainingRun
         with db_session() as session:
@@ -187,7 +212,10 @@ class GonzoExperimentCallback(keras.callbacks.Callback):
             session.refresh(run)
             self.run_id = run.run_id
             logger.info(
-                f"Created TrainingRun ID: {self.run_id} for Model ID: {self.model_id} with config path: {self.config_path}"
+                "Created TrainingRun ID: %s for Model ID: %s with config path: %s",
+                self.run_id,
+                self.model_id,
+                self.config_path,
             )
 
         # Initialize metric logger with the new run_id
@@ -220,17 +248,7 @@ class GonzoExperimentCallback(keras.callbacks.Callback):
 
             session.commit()
 
-        # Save model artifacts
-        # We need to gather metadata again or update it
-        metadata = {
-            "model_name": "f1_pit_strategy_model.keras",
-            "model_version": self.model_version,
-            "description": self.config.description or f"{self.config.model.type} model",
-            "created_by": "GonzoExperimentCallback",
-            "architecture": self.config.model.type,
-            "tags": self.config.tags,
-            "config": self.config.model_dump(),
-            # Add final metrics?
-        }
-
-        self.repo.update_model(self.model_id, self.model, self.model_version, metadata)
+        # Save model artifacts, reusing the metadata built at construction
+        self.repo.update_model(
+            self.model_id, self.model, self.model_version, self._metadata
+        )
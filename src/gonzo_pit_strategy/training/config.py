@@ -46,6 +46,23 @@ class TrainingConfig(BaseModel):
     test_size: float = Field(default=0.2, ge=0.0, le=1.0)
     validation_size: float = Field(default=0.1, ge=0.0, le=1.0)
     random_state: int = 42
+    use_dataset_cache: bool = Field(
+        default=False, description="Cache the loaded dataset on disk between runs"
+    )
+    dataset_cache_format: Literal["parquet", "tsv"] = Field(
+        default="parquet", description="On-disk format for the dataset cache"
+    )
+    use_split_cache: bool = Field(
+        default=False,
+        description=(
+            "Cache the prepared train/val/test arrays on disk, keyed by the "
+            "split parameters; clear data/cache after rebuilding the dbt dataset"
+        ),
+    )
+    numeric_downcast: bool = Field(
+        default=False,
+        description="Downcast float64 feature columns to float32 after loading",
+    )
 
     # Model params (Polymorphic!)
     model: ModelConfig = Field(default_factory=DenseModelConfig)
@@ -55,7 +72,35 @@ class TrainingConfig(BaseModel):
     epochs: int = 100
     learning_rate: float = 0.001
     early_stopping_patience: int = 10
+    checkpoint_weights_only: bool = Field(
+        default=True,
+        description="Checkpoint only the weights instead of the full model",
+    )
+    backup_only: bool = Field(
+        default=False,
+        description="Use a rolling BackupAndRestore checkpoint for crash recovery "
+        "instead of best-model checkpointing",
+    )
+    mixed_precision: Literal["float32", "mixed_float16", "mixed_bfloat16"] = Field(
+        default="float32",
+        description="Keras mixed-precision policy; the output layer always stays float32",
+    )
+    use_tf_data: bool = Field(
+        default=False,
+        description="Feed training through a tf.data pipeline with shuffling and prefetch",
+    )
 
     # Logging
     tags: List[str] = Field(default_factory=lambda: ["f1", "pit_strategy"])
     description: Optional[str] = None
+    tb_histogram_freq: int = Field(
+        default=0,
+        ge=0,
+        description="TensorBoard weight-histogram frequency in epochs; 0 disables",
+    )
+    tb_write_graph: bool = Field(
+        default=False, description="Write the model graph to TensorBoard"
+    )
+    tb_profile_batch: int = Field(
+        default=0, ge=0, description="Batch to profile in TensorBoard; 0 disables"
+    )
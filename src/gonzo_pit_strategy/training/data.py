@@ -2,19 +2,187 @@
 Data loading and preprocessing for training.
 """
 
+import hashlib
+from datetime import datetime
+
 import pandas as pd
 import numpy as np
+from pathlib import Path
 from sqlalchemy import create_engine
 from sqlalchemy.engine.url import URL
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from typing import Tuple, List
-from sklearn.model_selection import train_test_split
 
 from gonzo_pit_strategy.training.config import TrainingConfig
+from gonzo_pit_strategy.config.config import config as app_config
+from gonzo_pit_strategy.db.base import db_session
 from gonzo_pit_strategy.db.config import DatabaseConfig
+from gonzo_pit_strategy.db.models.dataset_versions import DatasetVersion
 from gonzo_pit_strategy.log.logger import get_logger
 
 logger = get_logger(__name__)
 
+DATASET_TABLE = "f1db_ml_prep.prep_training_dataset"
+
+# Row-chunk size for content hashing; bounds the intermediate hash buffer
+HASH_CHUNK_ROWS = 50_000
+
+
+def _compute_data_hash(df: pd.DataFrame) -> str:
+    """Compute a content hash of a DataFrame for dataset versioning.
+
+    The frame is hashed in row chunks so peak memory stays bounded by
+    HASH_CHUNK_ROWS uint64 entries regardless of dataset size.
+
+    Args:
+        df: DataFrame to fingerprint.
+
+    Returns:
+        Hex-encoded SHA-256 digest of the frame contents.
+    """
+    digest = hashlib.sha256()
+    for start in range(0, len(df), HASH_CHUNK_ROWS):
+        chunk = df.iloc[start : start + HASH_CHUNK_ROWS]
+        digest.update(pd.util.hash_pandas_object(chunk, index=False).values.tobytes())
+    return digest.hexdigest()
+
+
+def _save_dataset_version(df: pd.DataFrame, data_hash: str) -> None:
+    """Record the loaded dataset in f1db.dataset_versions.
+
+    Issues a single INSERT ... ON CONFLICT DO UPDATE so the bookkeeping
+    costs one round trip and is atomic, instead of a SELECT-then-branch.
+
+    Args:
+        df: The loaded training dataset.
+        data_hash: Content hash identifying this version of the dataset.
+    """
+    stmt = pg_insert(DatasetVersion).values(
+        dataset_name="prep_training_dataset",
+        version=data_hash[:12],
+        description="dbt-generated training dataset",
+        created_at=datetime.now(),
+        created_by="load_training_data",
+        data_path=DATASET_TABLE,
+        record_count=len(df),
+        feature_count=len(df.columns),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["dataset_name", "version"],
+        set_={
+            "created_at": stmt.excluded.created_at,
+            "record_count": stmt.excluded.record_count,
+            "feature_count": stmt.excluded.feature_count,
+        },
+    )
+    with db_session() as session:
+        session.execute(stmt)
+        session.commit()
+
+
+def _dataset_cache_path(cache_format: str) -> Path:
+    """Get the path of the on-disk dataset cache for the given format."""
+    extension = "parquet" if cache_format == "parquet" else "tsv"
+    return app_config.get_path("data/cache") / f"prep_training_dataset.{extension}"
+
+
+def _read_dataset_cache(cache_path: Path, cache_format: str) -> pd.DataFrame:
+    """Read a cached copy of the training dataset from disk."""
+    if cache_format == "parquet":
+        return pd.read_parquet(cache_path, engine="pyarrow")
+    return pd.read_csv(cache_path, sep="\t")
+
+
+def _write_dataset_cache(
+    df: pd.DataFrame, cache_path: Path, cache_format: str, downcast: bool = False
+) -> None:
+    """Write the training dataset to the on-disk cache.
+
+    The float32 downcast is only applied when the config downcasts anyway,
+    so cache hits and misses yield identical feature dtypes.
+    """
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    if cache_format == "parquet":
+        # Downcast float64 columns whose values fit in float32: halves the
+        # bytes written and the bandwidth of every subsequent cache load
+        downcast_map = (
+            {
+                col: "float32"
+                for col in df.select_dtypes("float64").columns
+                if df[col].abs().max() < np.finfo(np.float32).max
+            }
+            if downcast
+            else {}
+        )
+        if downcast_map:
+            df = df.astype(downcast_map)
+        df.to_parquet(
+            cache_path,
+            index=False,
+            engine="pyarrow",
+            compression="zstd",
+            compression_level=3,
+            use_dictionary=True,
+            row_group_size=64_000,
+        )
+    else:
+        df.to_csv(cache_path, sep="\t", index=False, chunksize=100_000)
+
+
+def _split_cache_path(config: TrainingConfig) -> Path:
+    """Cache path for the prepared train/val/test arrays.
+
+    The key covers every config parameter that shapes the arrays. It does not
+    cover the dataset contents, so the cache must be cleared after the dbt
+    dataset is rebuilt.
+
+    Args:
+        config: TrainingConfig with the data/split parameters.
+
+    Returns:
+        Path of the .npz file holding the six arrays and feature names.
+    """
+    key_source = "|".join(
+        (
+            config.target_column,
+            ",".join(config.exclude_columns),
+            str(config.test_size),
+            str(config.validation_size),
+            str(config.random_state),
+            str(config.numeric_downcast),
+        )
+    )
+    key = hashlib.sha256(key_source.encode()).hexdigest()[:16]
+    return app_config.get_path("data/cache") / f"prep_training_splits_{key}.npz"
+
+
+def _load_dataset(config: TrainingConfig) -> pd.DataFrame:
+    """Load the dbt-generated training dataset, using the local cache if enabled."""
+    cache_path = None
+    if config.use_dataset_cache:
+        cache_path = _dataset_cache_path(config.dataset_cache_format)
+        if cache_path.exists():
+            logger.info("Loading training dataset from cache: %s", cache_path)
+            return _read_dataset_cache(cache_path, config.dataset_cache_format)
+
+    logger.info("Loading training dataset from %s", DATASET_TABLE)
+    db_config = DatabaseConfig()
+    url_dict = db_config.get_db_url_dict()
+    engine = create_engine(URL.create(**url_dict))
+
+    try:
+        df = pd.read_sql(f"SELECT * FROM {DATASET_TABLE}", engine)
+    finally:
+        engine.dispose()
+
+    if cache_path is not None:
+        logger.info("Writing training dataset cache: %s", cache_path)
+        _write_dataset_cache(
+            df, cache_path, config.dataset_cache_format, downcast=config.numeric_downcast
+        )
+
+    return df
+
 
 def load_training_data(config: TrainingConfig,) -> Tuple[
     np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[str]
@@ -31,84 +199,159 @@ def load_training_data(config: TrainingConfig,) -> Tuple[
         - y_train, y_val, y_test (targets)
         - feature_names (list of column names used as features)
     """
-    # Connect to database and load dbt-generated training dataset
-    logger.info("Loading training dataset from f1db_ml_prep.prep_training_dataset")
-    db_config = DatabaseConfig()
-    url_dict = db_config.get_db_url_dict()
-    engine = create_engine(URL.create(**url_dict))
+    # Short-circuit the whole load/convert/split path when a cached set of
+    # prepared arrays exists for these parameters
+    split_cache_path = None
+    if config.use_split_cache:
+        split_cache_path = _split_cache_path(config)
+        if split_cache_path.exists():
+            logger.info("Loading train/val/test splits from cache: %s", split_cache_path)
+            cached = np.load(split_cache_path, allow_pickle=False)
+            return (
+                cached["X_train"],
+                cached["X_val"],
+                cached["X_test"],
+                cached["y_train"],
+                cached["y_val"],
+                cached["y_test"],
+                cached["feature_names"].tolist(),
+            )
 
-    try:
-        df = pd.read_sql("SELECT * FROM f1db_ml_prep.prep_training_dataset", engine)
-    finally:
-        engine.dispose()
+    df = _load_dataset(config)
 
-    logger.info(f"Data shape: {df.shape}")
+    logger.info("Data shape: %s", df.shape)
+    data_hash = _compute_data_hash(df)
+    logger.info("Dataset content hash: %s", data_hash)
+
+    # Dataset-version bookkeeping is best-effort; a failed upsert should not
+    # kill the training run
+    try:
+        _save_dataset_version(df, data_hash)
+    except Exception as e:
+        logger.warning("Could not record dataset version: %s", e)
 
     # Convert object dtype columns (typically all-NULL scaled columns) to float, filling NaN with 0
     object_cols = df.select_dtypes(include=["object"]).columns.tolist()
     if object_cols:
         logger.info(
-            f"Converting {len(object_cols)} object columns to float and filling NaN with 0: {object_cols}"
+            "Converting %d object columns to float and filling NaN with 0: %s",
+            len(object_cols),
+            object_cols,
+        )
+        # One batched conversion and a single block assignment instead of a
+        # per-column loop that rebinds (and reallocates) one column at a time
+        df[object_cols] = (
+            df[object_cols].apply(pd.to_numeric, errors="coerce").fillna(0.0)
         )
-        for col in object_cols:
-            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0.0)
 
-    # Fill any remaining NaN values with 0
-    nan_count = df.isnull().sum().sum()
-    if nan_count > 0:
-        nan_cols = df.columns[df.isnull().any()].tolist()
-        logger.info(f"Filling {nan_count} NaN values with 0 in columns: {nan_cols}")
-        df = df.fillna(0.0)
+    # Fill any remaining NaN values with 0: one isnull reduction to find the
+    # affected columns, then fill only those instead of copying the frame
+    nan_cols = df.columns[df.isnull().any()].tolist()
+    if nan_cols:
+        logger.info("Filling NaN values with 0 in columns: %s", nan_cols)
+        df[nan_cols] = df[nan_cols].fillna(0.0)
 
-    # Convert boolean OHE columns to integers for Keras
+    # Convert boolean OHE columns to integers for Keras; uint8 is enough for
+    # 0/1 indicators and holds them at 1/8 the footprint of int64
     ohe_cols = [
         col
         for col in df.columns
         if col.startswith(("circuit_", "team_", "driver_"))   # TODO: maybe append _ohe in the dbt pipeline to identify OHE columns instead of hard coding known OHE columns
         and not col.endswith("_scaled")
     ]
-    if ohe_cols:
-        logger.info(f"Converting {len(ohe_cols)} one-hot encoded columns to integers")
-        df[ohe_cols] = df[ohe_cols].astype(int)
+    # One set of the frame's columns for the membership checks below; O(1)
+    # lookups instead of scans over the column index
+    column_set = set(df.columns)
+    indicator_cols = [
+        col
+        for col in ("q1_time_missing", "q2_time_missing", "q3_time_missing", "is_dnf")
+        if col in column_set
+    ]
+    binary_cols = ohe_cols + [col for col in indicator_cols if col not in ohe_cols]
+    if binary_cols:
+        logger.info(
+            "Converting %d one-hot/indicator columns to uint8", len(binary_cols)
+        )
+        df[binary_cols] = df[binary_cols].astype(np.uint8)
+
+    # Optionally downcast float64 columns to float32: same feature values at
+    # half the bytes moved through cache by every downstream training pass
+    if config.numeric_downcast:
+        float_cols = df.select_dtypes("float64").columns.tolist()
+        if float_cols:
+            logger.info("Downcasting %d float64 columns to float32", len(float_cols))
+            df[float_cols] = df[float_cols].astype(np.float32)
 
     # Target handling
-    if config.target_column not in df.columns:
+    if config.target_column not in column_set:
         raise ValueError(f"Target column '{config.target_column}' not found in data")
 
-    y = df[config.target_column].values
+    # Materialize one homogeneous, contiguous buffer per array up front rather
+    # than letting .values assemble it implicitly; float32 when downcasting so
+    # the splits and the Keras input pipeline share the narrow dtype
+    matrix_dtype = np.float32 if config.numeric_downcast else np.float64
+    y = np.ascontiguousarray(df[config.target_column].to_numpy(dtype=matrix_dtype))
 
     # Feature selection (Exclude logic)
     cols_to_drop = [config.target_column] + config.exclude_columns
 
     # Filter out columns that might not exist to avoid errors
-    cols_to_drop = [col for col in cols_to_drop if col in df.columns]
+    cols_to_drop = [col for col in cols_to_drop if col in column_set]
 
-    X_df = df.drop(columns=cols_to_drop)
-    feature_names = X_df.columns.tolist()
-    X = X_df.values
+    # Drop in place: the pre-drop frame is discarded anyway, so there is no
+    # point allocating a second BlockManager for it
+    df.drop(columns=cols_to_drop, inplace=True)
 
-    logger.info(f"Features shape: {X.shape}, Target shape: {y.shape}")
-    logger.info(f"Excluded columns: {config.exclude_columns}")
-    logger.info(f"Selected {len(feature_names)} features")
+    # Any datetime column that survives the exclude list would break the
+    # homogeneous matrix conversion below (or silently degrade it to object);
+    # expose such columns as unix seconds instead
+    datetime_cols = df.select_dtypes(include=["datetime"]).columns.tolist()
+    if datetime_cols:
+        logger.info(
+            "Converting %d datetime columns to unix seconds: %s",
+            len(datetime_cols),
+            datetime_cols,
+        )
+        df[datetime_cols] = df[datetime_cols].astype("datetime64[s]").astype("int64")
 
-    # Split data
-    # First split off the test set
-    X_train_val, X_test, y_train_val, y_test = train_test_split(
-        X, y, test_size=config.test_size, random_state=config.random_state
-    )
+    feature_names = df.columns.tolist()
+    X = np.ascontiguousarray(df.to_numpy(dtype=matrix_dtype))
 
-    # Then split the remaining data into train and validation sets
-    # Adjust validation size relative to the remaining data
-    val_size_adjusted = config.validation_size / (1 - config.test_size)
-    X_train, X_val, y_train, y_val = train_test_split(
-        X_train_val,
-        y_train_val,
-        test_size=val_size_adjusted,
-        random_state=config.random_state,
-    )
+    logger.info("Features shape: %s, Target shape: %s", X.shape, y.shape)
+    logger.info("Excluded columns: %s", config.exclude_columns)
+    logger.info("Selected %d features", len(feature_names))
 
-    logger.info(f"Train set: {X_train.shape[0]} samples")
-    logger.info(f"Validation set: {X_val.shape[0]} samples")
-    logger.info(f"Test set: {X_test.shape[0]} samples")
+    # Split data with a single shuffled index permutation. The previous
+    # double train_test_split reshuffled and copied the full arrays twice
+    # (including an intermediate X_train_val); slicing one permutation by
+    # range copies each row exactly once
+    n_samples = len(X)
+    perm = np.random.default_rng(config.random_state).permutation(n_samples)
+    n_test = int(n_samples * config.test_size)
+    n_val = int(n_samples * config.validation_size)
+    test_idx = perm[:n_test]
+    val_idx = perm[n_test : n_test + n_val]
+    train_idx = perm[n_test + n_val :]
+
+    X_train, X_val, X_test = X[train_idx], X[val_idx], X[test_idx]
+    y_train, y_val, y_test = y[train_idx], y[val_idx], y[test_idx]
+
+    logger.info("Train set: %d samples", X_train.shape[0])
+    logger.info("Validation set: %d samples", X_val.shape[0])
+    logger.info("Test set: %d samples", X_test.shape[0])
+
+    if split_cache_path is not None:
+        logger.info("Writing split cache: %s", split_cache_path)
+        split_cache_path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            split_cache_path,
+            X_train=X_train,
+            X_val=X_val,
+            X_test=X_test,
+            y_train=y_train,
+            y_val=y_val,
+            y_test=y_test,
+            feature_names=np.array(feature_names),
+        )
 
     return X_train, X_val, X_test, y_train, y_val, y_test, feature_names
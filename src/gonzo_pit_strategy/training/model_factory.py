@@ -2,6 +2,8 @@
 Factory for building Keras models based on Pydantic configurations.
 """
 
+import types
+
 import keras
 from keras import layers, models, optimizers
 from typing import Tuple, Union
@@ -29,12 +31,19 @@ def build_model(
     """
     model_conf = config.model
 
-    if model_conf.type == "dense":
-        model = _build_dense(model_conf, input_shape, output_shape)
-    elif model_conf.type == "bilstm":
-        model = _build_bilstm(model_conf, input_shape, output_shape)
-    else:
-        raise ValueError(f"Unsupported model type: {model_conf.type}")
+    # Half-precision compute with float32 variables; Keras applies loss
+    # scaling automatically under mixed_float16. Always set the policy —
+    # it is process-global, and skipping the float32 case would leak a
+    # mixed policy from an earlier run into later ones (e.g. grid search)
+    keras.mixed_precision.set_global_policy(config.mixed_precision)
+
+    builder = MODEL_BUILDERS.get(model_conf.type)
+    if builder is None:
+        raise ValueError(
+            f"Unsupported model type: {model_conf.type}. "
+            f"Available types: {list(MODEL_BUILDERS)}"
+        )
+    model = builder(model_conf, input_shape, output_shape)
 
     # Compile model using training loop params from the main config
     model.compile(
@@ -56,7 +65,11 @@ def _build_dense(
         x = layers.Dense(units, activation=conf.activation)(x)
         x = layers.Dropout(conf.dropout_rate)(x)
 
-    outputs = layers.Dense(output_shape, activation=conf.output_activation)(x)
+    # Output stays float32 so the loss is computed at full precision even
+    # under a mixed-precision policy
+    outputs = layers.Dense(
+        output_shape, activation=conf.output_activation, dtype="float32"
+    )(x)
 
     return models.Model(inputs=inputs, outputs=outputs, name="dense_model")
 
@@ -111,6 +124,20 @@ def _build_bilstm(
         x = layers.Dense(units, activation=conf.activation)(x)
         x = layers.Dropout(conf.dropout_rate)(x)
 
-    outputs = layers.Dense(output_shape, activation=conf.output_activation)(x)
+    # Output stays float32 so the loss is computed at full precision even
+    # under a mixed-precision policy
+    outputs = layers.Dense(
+        output_shape, activation=conf.output_activation, dtype="float32"
+    )(x)
 
     return models.Model(inputs=inputs, outputs=outputs, name="bilstm_model")
+
+
+# Read-only builder registry, populated once at import so dispatch is a plain
+# dict lookup and the table cannot be mutated at runtime
+MODEL_BUILDERS = types.MappingProxyType(
+    {
+        "dense": _build_dense,
+        "bilstm": _build_bilstm,
+    }
+)
@@ -7,8 +7,13 @@ import time
 import keras
 from keras import callbacks
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Dict, Any, List, Optional
 
+from sqlalchemy import insert
+
+from gonzo_pit_strategy.db.base import db_session
+from gonzo_pit_strategy.db.models.training_metrics import TrainingMetric
 from gonzo_pit_strategy.training.config import TrainingConfig
 from gonzo_pit_strategy.training.data import load_training_data
 from gonzo_pit_strategy.training.model_factory import build_model
@@ -57,10 +62,10 @@ def run_experiment(
     input_shape = X_train.shape[1:]
     output_shape = 1 if len(y_train.shape) == 1 else y_train.shape[1]
 
-    logger.info(f"Input shape: {input_shape}, Output shape: {output_shape}")
+    logger.info("Input shape: %s, Output shape: %s", input_shape, output_shape)
 
     # 2. Build Model
-    logger.info(f"Building {config.model.type} model...")
+    logger.info("Building %s model...", config.model.type)
     model = build_model(config, input_shape, output_shape)
     model.summary()
 
@@ -85,12 +90,18 @@ def run_experiment(
     # Console Logger
     cb_list.append(ConsoleMetricsCallback())
 
-    # TensorBoard
+    # TensorBoard. Histograms, graph writing and profiling are off by
+    # default: per-epoch histograms alone walk every weight tensor and can
+    # eat a double-digit share of epoch time on larger models
     log_dir = os.path.join(tensorboard_log_dir, model_version)
     os.makedirs(log_dir, exist_ok=True)
     cb_list.append(
         callbacks.TensorBoard(
-            log_dir=log_dir, histogram_freq=1, write_graph=True, update_freq="epoch"
+            log_dir=log_dir,
+            histogram_freq=config.tb_histogram_freq,
+            write_graph=config.tb_write_graph,
+            profile_batch=config.tb_profile_batch,
+            update_freq="epoch",
         )
     )
 
@@ -105,30 +116,73 @@ def run_experiment(
             )
         )
 
-    # Checkpointing
-    checkpoint_path = os.path.join(checkpoint_dir, model_version, "model_checkpoint.h5")
-    os.makedirs(os.path.dirname(checkpoint_path), exist_ok=True)
-    cb_list.append(
-        callbacks.ModelCheckpoint(
-            filepath=checkpoint_path,
-            save_best_only=True,
-            monitor="val_loss",
-            mode="min",
-            verbose=1,
+    # Checkpointing. backup_only keeps a single rolling checkpoint purely for
+    # crash recovery — cheaper than best-model checkpointing, whose role is
+    # already covered in memory by early stopping's restore_best_weights.
+    # Otherwise checkpoint in the native Keras formats; weights-only by
+    # default, which skips re-serializing the whole model graph on every
+    # improvement. The final artifact is saved separately by the repository
+    if config.backup_only:
+        backup_dir = os.path.join(checkpoint_dir, model_version, "backup")
+        os.makedirs(backup_dir, exist_ok=True)
+        cb_list.append(callbacks.BackupAndRestore(backup_dir=backup_dir))
+    else:
+        checkpoint_name = (
+            "model_checkpoint.weights.h5"
+            if config.checkpoint_weights_only
+            else "model_checkpoint.keras"
+        )
+        checkpoint_path = os.path.join(checkpoint_dir, model_version, checkpoint_name)
+        os.makedirs(os.path.dirname(checkpoint_path), exist_ok=True)
+        cb_list.append(
+            callbacks.ModelCheckpoint(
+                filepath=checkpoint_path,
+                save_best_only=True,
+                save_weights_only=config.checkpoint_weights_only,
+                monitor="val_loss",
+                mode="min",
+                verbose=1,
+            )
         )
-    )
 
     # 4. Train
-    logger.info(f"Starting training for {config.epochs} epochs...")
-    history = model.fit(
-        X_train,
-        y_train,
-        validation_data=(X_val, y_val),
-        epochs=config.epochs,
-        batch_size=config.batch_size,
-        callbacks=cb_list,
-        verbose=1,
-    )
+    logger.info("Starting training for %d epochs...", config.epochs)
+    import tensorflow as tf
+
+    if config.use_tf_data:
+        # tf.data copies the arrays into tensors once and overlaps batch
+        # preparation with training via prefetch, instead of Keras re-slicing
+        # the raw NumPy arrays every epoch
+        train_ds = (
+            tf.data.Dataset.from_tensor_slices((X_train, y_train))
+            .shuffle(min(len(X_train), 8192), seed=config.random_state)
+            .batch(config.batch_size)
+            .prefetch(tf.data.AUTOTUNE)
+        )
+        val_ds = (
+            tf.data.Dataset.from_tensor_slices((X_val, y_val))
+            .batch(config.batch_size)
+            .prefetch(tf.data.AUTOTUNE)
+        )
+        history = model.fit(
+            train_ds,
+            validation_data=val_ds,
+            epochs=config.epochs,
+            callbacks=cb_list,
+            verbose=1,
+        )
+    else:
+        # Pin the arrays as constant tensors so the full dataset is converted
+        # (and copied to the device) once up front, not re-wrapped per epoch
+        history = model.fit(
+            tf.constant(X_train),
+            tf.constant(y_train),
+            validation_data=(tf.constant(X_val), tf.constant(y_val)),
+            epochs=config.epochs,
+            batch_size=config.batch_size,
+            callbacks=cb_list,
+            verbose=1,
+        )
 
     # 5. Evaluate
     logger.info("Evaluating on test set...")
@@ -138,8 +192,31 @@ def run_experiment(
         name: val for name, val in zip(model.metrics_names[1:], test_metric_values)
     }
 
-    logger.info(f"Test Loss: {test_loss}")
-    logger.info(f"Test Metrics: {test_metrics}")
+    logger.info("Test Loss: %s", test_loss)
+    logger.info("Test Metrics: %s", test_metrics)
+
+    # Record the test metrics against the run in one Core executemany INSERT;
+    # epoch -1 marks post-training evaluation. Best-effort like the rest of
+    # the run bookkeeping
+    if experiment_cb.run_id is not None:
+        timestamp = datetime.now()
+        rows = [
+            {
+                "run_id": experiment_cb.run_id,
+                "epoch": -1,
+                "timestamp": timestamp,
+                "metric_name": name,
+                "metric_value": float(value),
+                "split_type": "TEST",
+            }
+            for name, value in {"loss": test_loss, **test_metrics}.items()
+        ]
+        try:
+            with db_session() as session:
+                session.execute(insert(TrainingMetric), rows)
+                session.commit()
+        except Exception as e:
+            logger.warning("Could not record test metrics: %s", e)
 
     return ExperimentResult(
         model_version=model_version,
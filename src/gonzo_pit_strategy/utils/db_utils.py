@@ -2,6 +2,11 @@
 import os
 from typing import Optional
 
+# Resolved once at import: connection URLs are built at startup and the
+# variable does not change over the life of the process. Caveat: a PGPASSWORD
+# set programmatically after this module is imported is ignored
+_PGPASSWORD = os.environ.get("PGPASSWORD", "")
+
 def get_db_url(
     host: str = "localhost",
     port: int = 5432,
@@ -11,6 +16,5 @@ def get_db_url(
 ) -> str:
     """Get SQLAlchemy/Goose compatible connection string."""
     if not password:
-        password = os.environ.get("PGPASSWORD", "")
-        
+        password = _PGPASSWORD
     return f"postgres://{user}:{password}@{host}:{port}/{dbname}?sslmode=disable"
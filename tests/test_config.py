@@ -1,7 +1,7 @@
 """
-Test script for the configuration management system.
+Tests for the configuration management system.
 
-This script tests the basic functionality of the configuration management system.
+These tests cover config loading, path resolution, and environment detection.
 """
 import os
 
@@ -10,81 +10,42 @@ from gonzo_pit_strategy.config.config import config
 
 def test_config_loading():
     """Test loading configuration files."""
-    print("Testing configuration loading...")
+    # Each named config is loaded once and cached by name
+    database_config = config.get_config("database")
+    assert database_config
+    assert "development" in database_config
 
-    # Test loading model configuration
-    model_config = config.get_config("model")
-    print(f"Model configuration loaded: {bool(model_config)}")
-    print(f"Model name: {model_config.get('model_name', 'Not found')}")
+    logging_config = config.get_config("logging")
+    assert logging_config
+    assert logging_config.get("level")
 
-    # Test loading training configuration and getting model_type
-    training_config = config.get_config("training")
-    print(f"Model type from training config: {training_config.get('model_type', 'Not found')}")
+    # Repeated lookups hit the in-memory cache instead of re-reading disk
+    assert config.get_config("database") is database_config
 
-    # Test loading training configuration
-    training_config = config.get_config("training")
-    print(f"Training configuration loaded: {bool(training_config)}")
-    print(f"Epochs: {training_config.get('epochs', 'Not found')}")
-
-    # Test loading pipeline configuration
-    pipeline_config = config.get_config("pipeline")
-    print(f"Pipeline configuration loaded: {bool(pipeline_config)}")
-
-    print("Configuration loading tests completed.")
 
 def test_path_resolution():
     """Test path resolution."""
-    print("\nTesting path resolution...")
-
-    # Test resolving paths
-    data_path = config.get_path("data/processed")
-    print(f"Resolved data path: {data_path}")
+    assert config.get_path("data/processed") == config.project_root / "data/processed"
+    assert config.get_path("models/artifacts").is_absolute()
+    assert config.get_path("config") == config.config_dir
 
-    models_path = config.get_path("models/artifacts")
-    print(f"Resolved models path: {models_path}")
-
-    config_path = config.get_path("config")
-    print(f"Resolved config path: {config_path}")
-
-    print("Path resolution tests completed.")
 
 def test_environment():
     """Test environment detection."""
-    print("\nTesting environment detection...")
-
-    # Get current environment
-    env = config.environment
-    print(f"Current environment: {env}")
-
-    # Test changing environment
     original_env = os.environ.get("APP_ENV")
 
     try:
-        # Test with development environment
         os.environ["APP_ENV"] = "development"
-        print(f"Environment after setting to development: {config.environment}")
+        assert config.environment == "development"
 
-        # Test with production environment
         os.environ["APP_ENV"] = "production"
-        print(f"Environment after setting to production: {config.environment}")
+        assert config.environment == "production"
 
-        # Test with invalid environment
+        # Invalid environments fall back to the default
         os.environ["APP_ENV"] = "invalid"
-        print(f"Environment after setting to invalid: {config.environment}")
+        assert config.environment == "development"
     finally:
-        # Restore original environment
+        # Restore original environment with a single pop/set pair
+        os.environ.pop("APP_ENV", None)
         if original_env is not None:
             os.environ["APP_ENV"] = original_env
-        else:
-            os.environ.pop("APP_ENV", None)
-
-    print("Environment detection tests completed.")
-
-if __name__ == "__main__":
-    print("Testing configuration management system...\n")
-
-    test_config_loading()
-    test_path_resolution()
-    test_environment()
-
-    print("\nAll tests completed.")